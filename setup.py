@@ -0,0 +1,42 @@
+# setup.py
+
+# Project metadata lives in pyproject.toml; this file only declares the optional
+# Cython build of the hot-path modules. Compilation is opt-in so editable installs
+# (and coverage in CI) keep running the pure-Python sources:
+#
+#   TRADING_ENGINE_CORE_CYTHONIZE=1 python -m build --wheel
+#
+# The .py sources are always shipped and act as the fallback when no extension is built.
+
+# --- Built Ins  ---
+import os
+
+# --- Installed  ---
+from setuptools import Extension, setup
+
+CYTHON_MODULES = {
+    "trading_engine_core.models": "src/trading_engine_core/models.py",
+    "trading_engine_core.ohlc.transformer": "src/trading_engine_core/ohlc/transformer.py",
+}
+
+
+def _build_extensions() -> list[Extension]:
+    if os.environ.get("TRADING_ENGINE_CORE_CYTHONIZE") != "1":
+        return []
+
+    from Cython.Build import cythonize
+
+    return cythonize(
+        [Extension(name, [path]) for name, path in CYTHON_MODULES.items()],
+        compiler_directives={
+            "language_level": 3,
+            "boundscheck": False,
+            "wraparound": False,
+            # Keep annotations as hints: enforced `dict` arguments would raise TypeError on
+            # bad payloads the transformers are contracted to reject gracefully.
+            "annotation_typing": False,
+        },
+    )
+
+
+setup(ext_modules=_build_extensions())
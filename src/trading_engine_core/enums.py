@@ -1,13 +1,15 @@
 # src\trading_engine_core\enums.py
 
 # --- Built Ins  ---
-from enum import Enum
+from enum import StrEnum
 
 
-class MarketType(str, Enum):
+class MarketType(StrEnum):
     """
     The canonical, internal representation of all market types.
     This is the Single Source of Truth for the entire system.
+
+    Members are real `str` instances, so comparisons and serialization use the value directly.
     """
 
     SPOT = "spot"
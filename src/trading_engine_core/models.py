@@ -1,12 +1,50 @@
 # trading_engine_core/models.py
 
+from collections.abc import Sequence
 from datetime import datetime
-from typing import Any, Literal
+from functools import cached_property
+from operator import attrgetter
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+import msgspec
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
+
+# typing_extensions.TypedDict is the variant Pydantic recommends: it tracks the latest TypedDict
+# semantics independently of the interpreter's typing module. Declared as a direct dependency.
+from typing_extensions import TypedDict
 
 from .enums import MarketType
 
+__all__ = [
+    "EVENT_ADAPTER",
+    "OHLC_LIST_ADAPTER",
+    "AppBaseModel",
+    "BaseEvent",
+    "CycleClosedEvent",
+    "CycleCreatedEvent",
+    "CycleStateUpdatedEvent",
+    "EnhancedSignalEvent",
+    "Event",
+    "InstrumentModel",
+    "MarginCalculationResult",
+    "MarketContext",
+    "MarketDefinition",
+    "OHLCModel",
+    "OrderFilledEvent",
+    "OrderModel",
+    "OrderSentEvent",
+    "SignalEvent",
+    "SignalMeta",
+    "StreamMessage",
+    "SystemAlert",
+    "TakerMetrics",
+    "TradeNotification",
+]
+
+# Bypasses frozen-model __setattr__ when populating unvalidated instances.
+_object_setattr = object.__setattr__
+
 # --- Base Configuration ---
 
 
@@ -16,6 +54,8 @@ class AppBaseModel(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
         extra="ignore",
+        # Pinned explicitly: JSON ingest of repeated keys and Literal values (sides, order types) reuses cached str objects
+        cache_strings="all",
     )
 
 
@@ -48,8 +88,12 @@ class OHLCModel(AppBaseModel):
     """
     Standard Open-High-Low-Close candle data.
     Updated for Project Microstructure Alpha to include granular volume data.
+    Candles are immutable once built; frozen models skip the assignment validator chain.
+    Unknown keys are rejected rather than silently dropped.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     # [FIX] Added exchange field to ensure context is preserved in model dumps
     exchange: str | None = None
     instrument_name: str | None = None
@@ -68,10 +112,97 @@ class OHLCModel(AppBaseModel):
 
     open_interest: float | None = None
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "OHLCModel":
+        """
+        Builds a candle without validation, for internal producers only (e.g. our own
+        aggregator or rows already validated by `OHLC_LIST_ADAPTER`). `data` must use field
+        names and correctly typed values; external WebSocket/API payloads must go through
+        the validating constructor.
+
+        Same result as `model_construct`, but defaults are pre-resolved once, so it is faster
+        than validating (`model_construct` itself is slower than validation in pydantic 2.12).
+        """
+        candle = cls.__new__(cls)
+        _object_setattr(candle, "__dict__", {**_OHLC_FIELD_DEFAULTS, **data})
+        _object_setattr(candle, "__pydantic_fields_set__", set(data))
+        _object_setattr(candle, "__pydantic_extra__", None)
+        _object_setattr(candle, "__pydantic_private__", None)
+        return candle
+
+    @classmethod
+    def from_tuple(
+        cls,
+        tick: int,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        taker_buy_volume: float = 0.0,
+        taker_sell_volume: float = 0.0,
+        instrument_name: str | None = None,
+        resolution: str | None = None,
+        exchange: str | None = None,
+    ) -> "OHLCModel":
+        """
+        Positional trusted builder for producers that already hold a row tuple (e.g. a DB
+        record): `OHLCModel.from_tuple(*row)`. Same no-validation contract as `from_trusted`.
+        """
+        return cls.from_trusted(
+            {
+                "tick": tick,
+                "open": open_,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": volume,
+                "taker_buy_volume": taker_buy_volume,
+                "taker_sell_volume": taker_sell_volume,
+                "instrument_name": instrument_name,
+                "resolution": resolution,
+                "exchange": exchange,
+            }
+        )
+
+    @classmethod
+    def batch_validate(cls, rows: list[dict[str, Any]]) -> list["OHLCModel"]:
+        """
+        Validates a whole batch of candle dicts in one pydantic-core call via `OHLC_LIST_ADAPTER`.
+        Prefer this over `[OHLCModel(**row) for row in rows]` on ingest paths.
+        """
+        return OHLC_LIST_ADAPTER.validate_python(rows)
+
+    @classmethod
+    def to_soa(cls, candles: Sequence["OHLCModel"]) -> dict[str, np.ndarray]:
+        """
+        Converts a list of candles (AoS) into contiguous per-field columns (SoA) for column-wise
+        indicators: 'tick' is int64, the price/volume fields are float64. Keys match
+        `transform_tv_data_to_ohlc_arrays`, so the result also feeds `OHLCBatch.from_arrays`.
+        """
+        n = len(candles)
+        arrays = {"tick": np.fromiter(map(_get_tick, candles), dtype=np.int64, count=n)}
+        for name in _SOA_FLOAT_FIELDS:
+            arrays[name] = np.fromiter(map(attrgetter(name), candles), dtype=np.float64, count=n)
+        return arrays
+
+
+# Float columns emitted by `OHLCModel.to_soa`, in `OHLCBatch` column order.
+_SOA_FLOAT_FIELDS: tuple[str, ...] = ("open", "high", "low", "close", "volume", "taker_buy_volume", "taker_sell_volume")
+_get_tick = attrgetter("tick")
+
+# Resolved once for `OHLCModel.from_trusted`; every default is an immutable scalar, so sharing is safe.
+_OHLC_FIELD_DEFAULTS: dict[str, Any] = {name: field.default for name, field in OHLCModel.model_fields.items() if not field.is_required()}
+
+# Shared compiled validator for candle batches: one pydantic-core call per list instead of per row.
+OHLC_LIST_ADAPTER: TypeAdapter[list[OHLCModel]] = TypeAdapter(list[OHLCModel])
+
 
 class StreamMessage(AppBaseModel):
     """Standard wrapper for incoming WebSocket messages."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     channel: str
     exchange: str
     timestamp: int
@@ -130,18 +261,24 @@ class MarginCalculationResult(AppBaseModel):
 
 
 class BaseEvent(AppBaseModel):
-    """Abstract base for event-sourced activities."""
+    """
+    Abstract base for event-sourced activities. Events are immutable log entries.
+    Schema building is deferred (and inherited), so BaseEvent itself never builds one and each
+    event type pays its schema cost on first use rather than at import in every worker.
+    """
 
-    pass
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class CycleCreatedEvent(BaseEvent):
+    type: Literal["cycle_created"] = "cycle_created"
     strategy_name: str
     instrument_ticker: str
     initial_parameters: dict[str, Any]
 
 
 class OrderSentEvent(BaseEvent):
+    type: Literal["order_sent"] = "order_sent"
     order_id: str
     order_type: Literal["MARKET", "LIMIT", "STOP"]
     side: Literal["BUY", "SELL"]
@@ -150,6 +287,7 @@ class OrderSentEvent(BaseEvent):
 
 
 class OrderFilledEvent(BaseEvent):
+    type: Literal["order_filled"] = "order_filled"
     order_id: str
     fill_price: float
     fill_quantity: float
@@ -163,16 +301,28 @@ class CycleStateUpdatedEvent(BaseEvent):
     This makes the application's internal "thinking" process an auditable event.
     """
 
+    type: Literal["cycle_state_updated"] = "cycle_state_updated"
     previous_status: str
     new_status: str
     reason: str
 
 
 class CycleClosedEvent(BaseEvent):
+    type: Literal["cycle_closed"] = "cycle_closed"
     reason: str
     final_pnl: float
 
 
+# Tagged union of all event types: pydantic-core dispatches on `type` in O(1), no try-each-model walk.
+Event = Annotated[
+    CycleCreatedEvent | OrderSentEvent | OrderFilledEvent | CycleStateUpdatedEvent | CycleClosedEvent,
+    Field(discriminator="type"),
+]
+
+# Deferred like the event models themselves: the union schema is built on first validation.
+EVENT_ADAPTER: TypeAdapter[Event] = TypeAdapter(Event, config=ConfigDict(defer_build=True))
+
+
 # --- Notification Models ---
 
 
@@ -199,7 +349,6 @@ class TakerMetrics(BaseModel):
     Real-time microstructure metrics calculated by the Analyzer.
     """
 
-    """Real-time microstructure metrics."""
     symbol: str
     timestamp: float
     tbsr_5m: float = Field(default=1.0, description="Taker Buy/Sell Ratio (5 min)")
@@ -228,20 +377,67 @@ class MarketContext(BaseModel):
     sentiment_score: float = 0.5
 
 
+class SignalMeta(TypedDict, total=False):
+    """
+    Known signal metadata keys, validated with a fixed-shape schema instead of `dict[str, Any]`.
+    Strategy-specific extra keys are kept as-is.
+    """
+
+    __pydantic_config__ = ConfigDict(extra="allow")  # type: ignore[misc]
+
+    rvol: float
+    delta: float
+    venues: list[str]
+    source: str
+
+
+# Typed so `metadata_raw` holding a non-object (e.g. b"[1,2]") fails instead of returning a list.
+_METADATA_DECODER = msgspec.json.Decoder(dict[str, Any])
+
+
 class SignalEvent(BaseModel):
-    timestamp: float
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    # Unix ms, same unit as OHLCModel.tick. Strict, so legacy float-seconds producers fail loudly
+    # instead of being coerced (1672531200.0 would otherwise become a 1970 timestamp).
+    timestamp: int = Field(strict=True)
     strategy_name: str
     symbol: str
     exchange: str
     signal_type: str  # "LONG", "SHORT", "ALERT"
     strength: float  # 0.0 to 1.0 (RVOL / Max_RVOL)
-    metadata: dict[str, Any]  # {"rvol": 5.2, "delta": 0.4, "venues": [...]}
+    metadata: SignalMeta = Field(default_factory=dict)  # {"rvol": 5.2, "delta": 0.4, "venues": [...]}
+
+    # Serialized JSON metadata from producers that only route or log it; decoded on first access.
+    metadata_raw: bytes | None = None
+
+    @model_validator(mode="after")
+    def _check_metadata_source(self) -> "SignalEvent":
+        if self.metadata_raw is not None:
+            if "metadata" in self.model_fields_set:
+                raise ValueError("Pass either metadata or metadata_raw, not both")
+            # Cheap C-level check up front; the JSON itself is only parsed on access
+            try:
+                self.metadata_raw.decode()
+            except UnicodeDecodeError as e:
+                raise ValueError("metadata_raw must be UTF-8 encoded JSON") from e
+        return self
+
+    @cached_property
+    def metadata_decoded(self) -> dict[str, Any]:
+        """
+        Metadata as a dict: `metadata_raw` decoded once (unvalidated) if set, else `metadata`.
+        Raises msgspec.DecodeError / msgspec.ValidationError if the raw bytes are not a JSON object.
+        """
+        if self.metadata_raw:
+            return _METADATA_DECODER.decode(self.metadata_raw)
+        return dict(self.metadata)
 
 
 class EnhancedSignalEvent(BaseModel):
     """Signal Event enriched with Context."""
 
-    timestamp: float
+    timestamp: int = Field(strict=True)  # Unix ms; strict like SignalEvent.timestamp
     strategy_name: str
     symbol: str
     exchange: str
@@ -251,4 +447,4 @@ class EnhancedSignalEvent(BaseModel):
     # Enriched Payload
     metrics: TakerMetrics | None = None
     context: MarketContext | None = None
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: SignalMeta = Field(default_factory=dict)
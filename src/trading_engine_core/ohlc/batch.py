@@ -0,0 +1,175 @@
+# src/trading_engine_core/ohlc/batch.py
+
+# --- Built Ins  ---
+import time
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+# --- Installed  ---
+import numpy as np
+
+# --- Local Application Imports ---
+from trading_engine_core.models import OHLC_LIST_ADAPTER, OHLCModel
+from trading_engine_core.structs import OHLCStruct
+
+
+@dataclass(slots=True, eq=False)
+class OHLCBatch:
+    """
+    Column-oriented (SoA) container for one chunk of candles of a single instrument/resolution.
+
+    Holds one contiguous array per field instead of one object per candle, so bulk paths
+    (DB COPY, indicators) never allocate per-row objects. `len()`, indexing and iteration
+    emulate a list of rows via lightweight OHLCStruct views; `as_models()` yields the contract.
+    """
+
+    exchange: str
+    instrument_name: str
+    resolution: str
+    tick: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    taker_buy_volume: np.ndarray
+    taker_sell_volume: np.ndarray
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray], exchange: str, instrument_name: str, resolution: str) -> "OHLCBatch":
+        """Wraps the output of `transform_tv_data_to_ohlc_arrays` (an empty dict gives an empty batch)."""
+        if not arrays:
+            return cls.empty(exchange, instrument_name, resolution)
+        return cls(exchange, instrument_name, resolution, **arrays)
+
+    @classmethod
+    def empty(cls, exchange: str, instrument_name: str, resolution: str) -> "OHLCBatch":
+        """Returns a zero-length batch with correctly typed columns."""
+        floats = [np.empty(0, dtype=np.float64) for _ in range(7)]
+        return cls(exchange, instrument_name, resolution, np.empty(0, dtype=np.int64), *floats)
+
+    @classmethod
+    def concatenate(cls, batches: Sequence["OHLCBatch"]) -> "OHLCBatch":
+        """
+        Merges pages of the same instrument/resolution (e.g. from concurrently fetched
+        `iter_fetch_windows` chunks) with one `np.concatenate` per column, preserving page order.
+        """
+        if not batches:
+            raise ValueError("Cannot concatenate an empty sequence of batches")
+
+        first = batches[0]
+        key = (first.exchange, first.instrument_name, first.resolution)
+        if any((b.exchange, b.instrument_name, b.resolution) != key for b in batches):
+            raise ValueError("Can only concatenate batches of the same exchange, instrument and resolution")
+
+        columns = zip(*(b._columns() for b in batches), strict=True)
+        return cls(*key, *(np.concatenate(column) for column in columns))
+
+    def _columns(self) -> tuple[np.ndarray, ...]:
+        return (self.tick, self.open, self.high, self.low, self.close, self.volume, self.taker_buy_volume, self.taker_sell_volume)
+
+    def __len__(self) -> int:
+        return len(self.tick)
+
+    def __getitem__(self, index: int) -> OHLCStruct:
+        tick, open_, high, low, close, volume, taker_buy, taker_sell = (column[index].item() for column in self._columns())
+        return OHLCStruct(tick, open_, high, low, close, volume, self.exchange, self.instrument_name, self.resolution, taker_buy, taker_sell)
+
+    def __iter__(self) -> Iterator[OHLCStruct]:
+        exchange, instrument_name, resolution = self.exchange, self.instrument_name, self.resolution
+        for tick, open_, high, low, close, volume, taker_buy, taker_sell in zip(*(c.tolist() for c in self._columns()), strict=True):
+            yield OHLCStruct(tick, open_, high, low, close, volume, exchange, instrument_name, resolution, taker_buy, taker_sell)
+
+    def records(self) -> Iterator[tuple]:
+        """
+        Yields DB-ready tuples in `OHLC_RECORD_FIELDS` order (for asyncpg `copy_records_to_table`),
+        zipping the columns once without creating any model objects.
+        """
+        exchange, instrument_name, resolution = self.exchange, self.instrument_name, self.resolution
+        for row in zip(*(c.tolist() for c in self._columns()), strict=True):
+            yield (*row, exchange, instrument_name, resolution)
+
+    def as_models(self) -> list[OHLCModel]:
+        """
+        Materializes the batch as the external OHLCModel contract (legacy list-of-models API).
+        All rows are validated in one pydantic-core call via `OHLC_LIST_ADAPTER`.
+        """
+        exchange, instrument_name, resolution = self.exchange, self.instrument_name, self.resolution
+        rows = [
+            {
+                "exchange": exchange,
+                "instrument_name": instrument_name,
+                "resolution": resolution,
+                "tick": tick,
+                "open": open_,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": volume,
+                "taker_buy_volume": taker_buy,
+                "taker_sell_volume": taker_sell,
+            }
+            # .tolist() converts each column to native int/float in one C call
+            for tick, open_, high, low, close, volume, taker_buy, taker_sell in zip(*(c.tolist() for c in self._columns()), strict=True)
+        ]
+        return OHLC_LIST_ADAPTER.validate_python(rows)
+
+
+class OhlcFlushBuffer:
+    """
+    Accumulates OHLCBatch pages of one instrument/resolution and releases them as a single
+    concatenated batch once `flush_rows` rows are held or `flush_ms` has elapsed since the
+    first buffered page, so one large COPY/upsert replaces one statement per page.
+
+    `add` and `drain` never await, so a buffer shared by coroutines on one event loop
+    needs no lock.
+    """
+
+    __slots__ = ("flush_rows", "flush_ms", "_pages", "_rows", "_started")
+
+    def __init__(self, flush_rows: int = 50_000, flush_ms: int = 500):
+        if flush_rows <= 0 or flush_ms <= 0:
+            raise ValueError("flush_rows and flush_ms must be positive")
+        self.flush_rows = flush_rows
+        self.flush_ms = flush_ms
+        self._pages: list[OHLCBatch] = []
+        self._rows = 0
+        self._started = 0.0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def add(self, batch: OHLCBatch) -> OHLCBatch | None:
+        """
+        Buffers a page. Returns the drained batch when a threshold is reached, else None.
+        Raises ValueError (leaving the buffer untouched) for a page of another
+        exchange, instrument or resolution than the pages already held.
+        """
+        if not len(batch):
+            return None
+        if not self._pages:
+            self._started = time.monotonic()
+        else:
+            first = self._pages[0]
+            if (batch.exchange, batch.instrument_name, batch.resolution) != (first.exchange, first.instrument_name, first.resolution):
+                raise ValueError("OhlcFlushBuffer holds pages of a single exchange, instrument and resolution")
+        self._pages.append(batch)
+        self._rows += len(batch)
+
+        if self._rows >= self.flush_rows or (time.monotonic() - self._started) * 1000 >= self.flush_ms:
+            return self.drain()
+        return None
+
+    def drain(self) -> OHLCBatch | None:
+        """
+        Returns everything buffered as one batch (None if empty) and resets the buffer.
+        Call it once more after the last page to flush the remainder.
+        """
+        if not self._pages:
+            return None
+        pages = self._pages
+        merged = pages[0] if len(pages) == 1 else OHLCBatch.concatenate(pages)
+        # Reset only once the merge succeeded, so a failure never discards buffered rows
+        self._pages = []
+        self._rows = 0
+        return merged
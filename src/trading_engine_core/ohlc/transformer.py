@@ -1,13 +1,133 @@
 # src/trading_engine_core/ohlc/transformer.py
 
 # --- Built Ins  ---
+import sys
+from collections.abc import Iterator, Sequence
+from itertools import repeat
+from operator import itemgetter
 from typing import Any
 
 # --- Installed  ---
+import msgspec
+import numpy as np
 from loguru import logger as log
+from pydantic import ValidationError
 
 # --- Local Application Imports ---
 from trading_engine_core.models import OHLCModel
+from trading_engine_core.ohlc.batch import OHLCBatch
+from trading_engine_core.structs import OHLCStruct, TVResponse
+
+# Log calls pass values as loguru format args rather than f-strings: the message is only
+# formatted when a sink accepts the record, and payload text containing braces cannot break it.
+
+# Reused across calls; decoding straight from bytes skips the intermediate stdlib-json dict.
+_TV_RESPONSE_DECODER = msgspec.json.Decoder(TVResponse)
+
+# Column order of the tuples produced by `transform_tv_data_to_ohlc_records` / `OHLCBatch.records`.
+# Pass as the `columns` argument to asyncpg `copy_records_to_table`.
+OHLC_RECORD_FIELDS: tuple[str, ...] = (
+    "tick",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "taker_buy_volume",
+    "taker_sell_volume",
+    "exchange",
+    "instrument_name",
+    "resolution",
+)
+
+
+# Standard columns every TV payload must carry, in `_extract_tv_columns` output order.
+_TV_OHLC_KEYS: tuple[str, ...] = ("ticks", "open", "high", "low", "close", "volume")
+_REQUIRED_TV_KEYS = frozenset(_TV_OHLC_KEYS)
+_get_tv_ohlc_columns = itemgetter(*_TV_OHLC_KEYS)
+
+# Sized but not column sequences: len() succeeds on them, iteration yields characters/ints.
+_TEXT_TYPES = (str, bytes, bytearray)
+
+
+def _extract_tv_columns(tv_data: dict[str, Any], instrument_name: str) -> tuple[Sequence | None, ...] | None:
+    """
+    Validates the shape of TradingView-style chart data and returns its columns:
+    (ticks, opens, highs, lows, closes, volumes, taker_buys, taker_sells).
+    The microstructure columns are None when absent or not matching the OHLC length.
+    Returns None if the payload is empty or unusable (the latter is logged).
+    """
+    if not isinstance(tv_data, dict):
+        log.error("Invalid TV data type for {}: {}", instrument_name, type(tv_data))
+        return None
+
+    # One set comparison replaces a .get() per column and catches missing keys before any work
+    if not _REQUIRED_TV_KEYS <= tv_data.keys():
+        log.error("Missing OHLC keys for {}: {}. Skipping chunk.", instrument_name, sorted(_REQUIRED_TV_KEYS - tv_data.keys()))
+        return None
+
+    ticks, opens, highs, lows, closes, volumes = columns = _get_tv_ohlc_columns(tv_data)
+
+    # Validate Standard Fields: one duck-typed len() probe per column; non-sequences raise TypeError.
+    # Strings are sized too but would be iterated per character, so they are rejected explicitly.
+    try:
+        if any(isinstance(column, _TEXT_TYPES) for column in columns):
+            raise TypeError
+        lengths = {len(column) for column in columns}
+    except TypeError:
+        log.error("API returned non-list data for {}. Skipping chunk.", instrument_name)
+        return None
+
+    if len(lengths) != 1:
+        log.error("Mismatched OHLC array lengths for {}. Skipping chunk.", instrument_name)
+        return None
+    length = lengths.pop()
+    if not length:
+        # An empty window is a normal response, not an error
+        return None
+
+    # Optional Microstructure Arrays
+    taker_buys = tv_data.get("taker_buy_volume", ())
+    taker_sells = tv_data.get("taker_sell_volume", ())
+
+    # Check if Microstructure data matches length (e.g. absent on Deribit API, or null)
+    try:
+        sized = len(taker_buys) == length and len(taker_sells) == length
+    except TypeError:
+        sized = False
+    if not sized:
+        taker_buys = taker_sells = None
+
+    return ticks, opens, highs, lows, closes, volumes, taker_buys, taker_sells
+
+
+def _labels_valid(exchange_name: Any, instrument_name: Any, resolution_str: Any) -> bool:
+    """
+    Checks the per-chunk labels once, so every entry point rejects what OHLCModel would
+    (labels must be str or None) instead of only the validated model path failing.
+    """
+    if all(label is None or type(label) is str for label in (exchange_name, instrument_name, resolution_str)):
+        return True
+    log.error("Invalid OHLC labels for {}: {!r}, {!r}. Skipping chunk.", instrument_name, exchange_name, resolution_str)
+    return False
+
+
+def _extract_tv_rows(tv_data: dict[str, Any], instrument_name: str) -> Iterator[tuple] | None:
+    """
+    Returns a row iterator over validated TV columns:
+    (tick, open, high, low, close, volume, taker_buy, taker_sell).
+    Missing microstructure values default to 0.0. Returns None if the payload is unusable.
+    """
+    columns = _extract_tv_columns(tv_data, instrument_name)
+    if columns is None:
+        return None
+
+    ticks, opens, highs, lows, closes, volumes, taker_buys, taker_sells = columns
+    if taker_buys is None:
+        taker_buys = taker_sells = repeat(0.0)
+
+    # Lengths are validated above, so a columnar zip replaces per-index lookups
+    return zip(ticks, opens, highs, lows, closes, volumes, taker_buys, taker_sells, strict=False)
 
 
 def transform_tv_data_to_ohlc_models(
@@ -21,62 +141,180 @@ def transform_tv_data_to_ohlc_models(
 
     Updated for Microstructure Alpha:
     - Parses 'taker_buy_volume' and 'taker_sell_volume' arrays if present.
+
+    Values are cast column-wise by NumPy into an OHLCBatch, then all rows are validated
+    in a single pydantic-core call (`OHLC_LIST_ADAPTER`) instead of one model call per candle.
     """
-    records: list[OHLCModel] = []
     try:
-        if not isinstance(tv_data, dict):
-            log.error(f"Invalid TV data type for {instrument_name}: {type(tv_data)}")
-            return []
+        return transform_tv_data_to_ohlc_batch(tv_data, exchange_name, instrument_name, resolution_str).as_models()
+    except ValidationError as e:
+        log.error("Error validating TV data for {}: {}", instrument_name, e)
+        return []
 
-        ticks = tv_data.get("ticks", [])
-        opens = tv_data.get("open", [])
-        highs = tv_data.get("high", [])
-        lows = tv_data.get("low", [])
-        closes = tv_data.get("close", [])
-        volumes = tv_data.get("volume", [])
-
-        # Optional Microstructure Arrays
-        taker_buys = tv_data.get("taker_buy_volume", [])
-        taker_sells = tv_data.get("taker_sell_volume", [])
-
-        # Validate Standard Fields
-        mandatory_lists = [ticks, opens, highs, lows, closes, volumes]
-        if not all(isinstance(lst, list) for lst in mandatory_lists):
-            log.error(f"API returned non-list data for {instrument_name}. Skipping chunk.")
-            return []
 
-        length = len(ticks)
-        if not all(len(lst) == length for lst in mandatory_lists):
-            log.error(f"Mismatched OHLC array lengths for {instrument_name}. Skipping chunk.")
-            return []
+def transform_tv_data_to_ohlc_structs(
+    tv_data: dict[str, Any],
+    exchange_name: str,
+    instrument_name: str,
+    resolution_str: str,
+) -> list[OHLCStruct]:
+    """
+    Fast-path variant of `transform_tv_data_to_ohlc_models` for bulk persistence.
 
-        # Check if Microstructure data matches length
-        has_micro_data = len(taker_buys) == length and len(taker_sells) == length
+    Builds validation-free OHLCStructs instead of Pydantic models. Values are cast
+    explicitly here, so the structs are as trustworthy as the model output.
+    Consumers should use `msgspec.structs.asdict` rather than `model_dump()`.
+    """
+    if not _labels_valid(exchange_name, instrument_name, resolution_str):
+        return []
 
-        for i in range(length):
-            model = OHLCModel(
-                exchange=exchange_name,
-                instrument_name=instrument_name,
-                resolution=resolution_str,
-                tick=int(ticks[i]),
-                open=float(opens[i]),
-                high=float(highs[i]),
-                low=float(lows[i]),
-                close=float(closes[i]),
-                volume=float(volumes[i]),
-                # Default to 0.0 if not present (e.g. Deribit API)
-                taker_buy_volume=float(taker_buys[i]) if has_micro_data else 0.0,
-                taker_sell_volume=float(taker_sells[i]) if has_micro_data else 0.0,
+    try:
+        rows = _extract_tv_rows(tv_data, instrument_name)
+        if rows is None:
+            return []
+
+        # Positional construction follows OHLCStruct field order (cheaper than kwargs dispatch)
+        records = [
+            OHLCStruct(
+                int(tick),
+                float(open_),
+                float(high),
+                float(low),
+                float(close),
+                float(volume),
+                exchange_name,
+                instrument_name,
+                resolution_str,
+                float(taker_buy),
+                float(taker_sell),
             )
-            records.append(model)
+            for tick, open_, high, low, close, volume, taker_buy, taker_sell in rows
+        ]
 
-    except (TypeError, IndexError, ValueError) as e:
-        log.error(f"Error processing TV data for {instrument_name}: {e}", exc_info=True)
+    except (TypeError, ValueError, OverflowError) as e:
+        # Uncastable values are an expected data condition: log the cause, not a traceback
+        log.error("Error processing TV data for {}: {}", instrument_name, e)
         return []
 
     return records
 
 
+def transform_tv_bytes_to_ohlc_structs(
+    body: bytes,
+    exchange_name: str,
+    instrument_name: str,
+    resolution_str: str,
+) -> list[OHLCStruct]:
+    """
+    Decodes a raw TradingView-style JSON response body straight into OHLCStructs.
+
+    Parsing and per-column type validation happen in a single msgspec pass over the bytes,
+    so no per-value casts are needed here. Intended for clients that return the raw HTTP body.
+    """
+    if not _labels_valid(exchange_name, instrument_name, resolution_str):
+        return []
+
+    try:
+        response = _TV_RESPONSE_DECODER.decode(body)
+    except msgspec.DecodeError as e:
+        log.error("Error decoding TV data for {}: {}", instrument_name, e)
+        return []
+
+    length = len(response.ticks)
+    columns = (response.open, response.high, response.low, response.close, response.volume)
+    if any(len(column) != length for column in columns):
+        log.error("Mismatched OHLC array lengths for {}. Skipping chunk.", instrument_name)
+        return []
+
+    taker_buys, taker_sells = response.taker_buy_volume, response.taker_sell_volume
+    if len(taker_buys) != length or len(taker_sells) != length:
+        taker_buys = taker_sells = repeat(0.0)
+
+    return [
+        OHLCStruct(tick, open_, high, low, close, volume, exchange_name, instrument_name, resolution_str, taker_buy, taker_sell)
+        for tick, open_, high, low, close, volume, taker_buy, taker_sell in zip(response.ticks, *columns, taker_buys, taker_sells, strict=False)
+    ]
+
+
+def transform_tv_data_to_ohlc_records(
+    tv_data: dict[str, Any],
+    exchange_name: str,
+    instrument_name: str,
+    resolution_str: str,
+) -> Iterator[tuple]:
+    """
+    Streams TradingView-style chart data as DB-ready tuples ordered as `OHLC_RECORD_FIELDS`,
+    for direct use as `copy_records_to_table(records=...)`. No models, dicts or intermediate
+    list of rows are built. Values are cast column-wise up front, so the iterator cannot fail
+    mid-COPY. Yields nothing if the payload is unusable.
+    """
+    return transform_tv_data_to_ohlc_batch(tv_data, exchange_name, instrument_name, resolution_str).records()
+
+
+def transform_tv_data_to_ohlc_arrays(tv_data: dict[str, Any], instrument_name: str) -> dict[str, np.ndarray]:
+    """
+    Transforms TradingView-style chart data into contiguous NumPy columns, never
+    materializing per-candle objects. Keys follow OHLCModel field names:
+    'tick' (int64) plus 'open', 'high', 'low', 'close', 'volume',
+    'taker_buy_volume', 'taker_sell_volume' (float64).
+
+    Returns an empty dict if the payload is unusable.
+    """
+    columns = _extract_tv_columns(tv_data, instrument_name)
+    if columns is None:
+        return {}
+
+    ticks, opens, highs, lows, closes, volumes, taker_buys, taker_sells = columns
+    length = len(ticks)
+
+    try:
+        # NumPy would silently cast None to NaN in float columns; reject nulls like float(None) does
+        if any(column is not None and None in column for column in columns[1:]):
+            log.error("Null OHLC values for {}. Skipping chunk.", instrument_name)
+            return {}
+
+        arrays = {
+            "tick": np.asarray(ticks, dtype=np.int64),
+            "open": np.asarray(opens, dtype=np.float64),
+            "high": np.asarray(highs, dtype=np.float64),
+            "low": np.asarray(lows, dtype=np.float64),
+            "close": np.asarray(closes, dtype=np.float64),
+            "volume": np.asarray(volumes, dtype=np.float64),
+            "taker_buy_volume": np.zeros(length) if taker_buys is None else np.asarray(taker_buys, dtype=np.float64),
+            "taker_sell_volume": np.zeros(length) if taker_sells is None else np.asarray(taker_sells, dtype=np.float64),
+        }
+    except (TypeError, ValueError, OverflowError) as e:
+        log.error("Error processing TV data for {}: {}", instrument_name, e)
+        return {}
+
+    # Nested sequences would silently produce 2-D arrays
+    if any(arr.shape != (length,) for arr in arrays.values()):
+        log.error("Non-scalar OHLC values for {}. Skipping chunk.", instrument_name)
+        return {}
+
+    return arrays
+
+
+def transform_tv_data_to_ohlc_batch(
+    tv_data: dict[str, Any],
+    exchange_name: str,
+    instrument_name: str,
+    resolution_str: str,
+) -> OHLCBatch:
+    """
+    Transforms TradingView-style chart data into a columnar OHLCBatch.
+    Returns an empty batch if the payload or its labels are unusable.
+    """
+    if not _labels_valid(exchange_name, instrument_name, resolution_str):
+        return OHLCBatch.empty(exchange_name, instrument_name, resolution_str)
+    arrays = transform_tv_data_to_ohlc_arrays(tv_data, instrument_name)
+    return OHLCBatch.from_arrays(arrays, exchange_name, instrument_name, resolution_str)
+
+
+def _intern_label(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
 def transform_canonical_list_to_ohlc_models(data: list[dict[str, Any]]) -> list[OHLCModel]:
     """
     Transforms a list of canonical dictionaries (Row-based) into OHLCModels.
@@ -86,9 +324,10 @@ def transform_canonical_list_to_ohlc_models(data: list[dict[str, Any]]) -> list[
     for item in data:
         try:
             model = OHLCModel(
-                exchange=item["exchange"],
-                instrument_name=item["instrument_name"],
-                resolution=item["resolution"],
+                # Each row carries its own label strings; intern them so equal labels share one object
+                exchange=_intern_label(item["exchange"]),
+                instrument_name=_intern_label(item["instrument_name"]),
+                resolution=_intern_label(item["resolution"]),
                 tick=item["tick"],
                 open=item["open"],
                 high=item["high"],
@@ -102,7 +341,7 @@ def transform_canonical_list_to_ohlc_models(data: list[dict[str, Any]]) -> list[
             )
             records.append(model)
         except (KeyError, ValueError) as e:
-            log.error(f"Failed to transform row to OHLCModel: {e}. Row: {item}")
+            log.error("Failed to transform row to OHLCModel: {}. Row: {}", e, item)
             continue
 
     return records
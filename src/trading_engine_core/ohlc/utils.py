@@ -0,0 +1,111 @@
+# src/trading_engine_core/ohlc/utils.py
+
+# --- Built Ins  ---
+import fnmatch
+import random
+import re
+import time
+from collections.abc import Callable, Iterable, Iterator
+from datetime import timedelta
+from functools import lru_cache
+
+_MINUTE_MS = 60_000
+
+# Retry/idle delays in seconds, computed once at import: 0.1s doubling up to a 10s cap.
+BACKOFF_SCHEDULE: tuple[float, ...] = tuple(min(10.0, 0.1 * 2**i) for i in range(8))
+
+# Characters that make a whitelist entry a glob pattern rather than an exact instrument name.
+_GLOB_CHARS = frozenset("*?[")
+
+# Candle width per resolution unit suffix, in milliseconds.
+_UNIT_MS: dict[str, int] = {
+    "m": _MINUTE_MS,
+    "h": 60 * _MINUTE_MS,
+    "D": 1_440 * _MINUTE_MS,
+    "d": 1_440 * _MINUTE_MS,
+    "W": 10_080 * _MINUTE_MS,
+    "w": 10_080 * _MINUTE_MS,
+}
+
+
+def utc_now_ms() -> int:
+    """Current Unix time in integer milliseconds (no datetime construction)."""
+    return time.time_ns() // 1_000_000
+
+
+@lru_cache(maxsize=32)
+def resolution_to_ms(resolution: str) -> int:
+    """
+    Converts a resolution string into its candle width in integer milliseconds.
+    Accepts TradingView-style minute counts ("1", "60") and unit-suffixed values ("5m", "1h", "1D", "W").
+    Keeps backfill window math (`now_ms - target_candles * res_ms`) in pure integer arithmetic.
+
+    Memoized: resolutions come from a small fixed set, so repeat calls in paginated loops are a dict hit.
+    """
+    res = str(resolution).strip()
+    if res.isdigit():
+        count, unit_ms = int(res), _MINUTE_MS
+    else:
+        count_str, unit = res[:-1] or "1", res[-1:]
+        if unit not in _UNIT_MS or not count_str.isdigit():
+            raise ValueError(f"Unsupported resolution: {resolution!r}")
+        count, unit_ms = int(count_str), _UNIT_MS[unit]
+
+    if count <= 0:
+        raise ValueError(f"Resolution must be positive: {resolution!r}")
+    return count * unit_ms
+
+
+@lru_cache(maxsize=32)
+def parse_resolution_to_timedelta(resolution: str) -> timedelta:
+    """
+    Memoized timedelta form of `resolution_to_ms`, a drop-in for the DB client's
+    per-call `_parse_resolution_to_timedelta`. Resolve once before entering fetch loops.
+    """
+    return timedelta(milliseconds=resolution_to_ms(resolution))
+
+
+def iter_fetch_windows(start_ts: int, end_ts: int, resolution_ms: int, chunk_candles: int) -> Iterator[tuple[int, int]]:
+    """
+    Splits [start_ts, end_ts) into consecutive (chunk_start, chunk_end) ms windows of at most
+    `chunk_candles` candles each. Windows depend only on the inputs, never on API responses,
+    so the next chunk's request can be issued (prefetched) while the current one is persisted.
+    """
+    if resolution_ms <= 0 or chunk_candles <= 0:
+        raise ValueError("resolution_ms and chunk_candles must be positive")
+
+    span_ms = resolution_ms * chunk_candles
+    for chunk_start in range(start_ts, end_ts, span_ms):
+        yield chunk_start, min(chunk_start + span_ms, end_ts)
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Jittered delay for the given 0-based retry attempt, for `await asyncio.sleep(backoff_delay(n))`.
+    Attempts past the end of `BACKOFF_SCHEDULE` reuse the cap. The 0.5x-1.5x jitter spreads
+    worker wakeups so they do not hit Redis in lockstep after an outage. Reset `attempt` on success.
+    """
+    return BACKOFF_SCHEDULE[min(attempt, len(BACKOFF_SCHEDULE) - 1)] * (0.5 + random.random())
+
+
+def compile_instrument_whitelist(entries: Iterable[str]) -> Callable[[str], bool]:
+    """
+    Builds a membership predicate for a backfill whitelist such as `["BTC-PERP", "ETH-*"]`.
+    Exact names go into a frozenset (O(1) lookup); glob entries are merged into one compiled
+    regex, so a lookup is at most one hash probe plus one C-level match however long the list is.
+    Compile once at construction, not per candidate instrument. An empty whitelist matches nothing.
+    """
+    exact: set[str] = set()
+    patterns: list[str] = []
+    for entry in entries:
+        if _GLOB_CHARS.isdisjoint(entry):
+            exact.add(entry)
+        else:
+            patterns.append(fnmatch.translate(entry))
+
+    exact_names = frozenset(exact)
+    if not patterns:
+        return exact_names.__contains__
+
+    match = re.compile("|".join(patterns)).match
+    return lambda instrument: instrument in exact_names or match(instrument) is not None
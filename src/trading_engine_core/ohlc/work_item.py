@@ -0,0 +1,62 @@
+# src/trading_engine_core/ohlc/work_item.py
+
+# --- Built Ins  ---
+from collections.abc import Iterable
+from typing import Literal
+
+# --- Installed  ---
+import msgspec
+
+
+class WorkItem(msgspec.Struct, frozen=True):
+    """
+    A unit of OHLC backfill work passed between the discovery step and workers via Redis.
+    Typed attribute access replaces dict subscripts like `work_item["exchange"]`.
+    Frozen, so a dequeued item can be shared or used as a dict key safely.
+    """
+
+    type: str
+    exchange: str
+    instrument: str
+    resolution: str
+    start_ts: int
+    end_ts: int
+    market_type: str = "spot"
+
+
+# "msgpack" is the compact default wire format; "json" keeps payloads readable from `redis-cli`.
+WireFormat = Literal["msgpack", "json"]
+
+# Built once; reusing encoder/decoder instances avoids per-call setup.
+_ENCODERS = {
+    "msgpack": msgspec.msgpack.Encoder(),
+    "json": msgspec.json.Encoder(),
+}
+_MSGPACK_DECODER = msgspec.msgpack.Decoder(WorkItem)
+_JSON_DECODER = msgspec.json.Decoder(WorkItem)
+
+
+def encode_work_item(item: WorkItem, wire_format: WireFormat = "msgpack") -> bytes:
+    """Serializes a WorkItem for the Redis queue (msgpack unless `wire_format="json"`)."""
+    return _ENCODERS[wire_format].encode(item)
+
+
+def encode_work_items(items: Iterable[WorkItem], wire_format: WireFormat = "msgpack") -> list[bytes]:
+    """
+    Serializes many work items at once for a single `RPUSH key *payloads` (or pipeline),
+    collapsing N enqueue round-trips into one.
+    """
+    encode = _ENCODERS[wire_format].encode
+    return [encode(item) for item in items]
+
+
+def decode_work_item(raw: bytes | str) -> WorkItem:
+    """
+    Parses and validates a queued work item in a single pass.
+    The format is detected per payload: a msgpack map never starts with "{", so JSON items
+    from older or debug producers still decode while a queue migrates.
+    Raises msgspec.ValidationError / msgspec.DecodeError on malformed payloads.
+    """
+    if isinstance(raw, str) or raw[:1] == b"{":
+        return _JSON_DECODER.decode(raw)
+    return _MSGPACK_DECODER.decode(raw)
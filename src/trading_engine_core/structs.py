@@ -0,0 +1,139 @@
+# src/trading_engine_core/structs.py
+
+# --- Built Ins  ---
+from datetime import datetime
+from typing import Any, Literal
+
+# --- Installed  ---
+import msgspec
+
+# --- Local Application Imports ---
+from trading_engine_core.models import SignalMeta
+
+# --- Internal Fast-Path Structs ---
+# These mirror the Pydantic contracts in `models.py` for bulk, performance-critical paths.
+# They perform no validation on construction; callers must pass already shape-checked data.
+
+
+class OHLCStruct(msgspec.Struct, frozen=True):
+    """
+    Lightweight mirror of OHLCModel used by the OHLC transform -> persist path.
+    Convert to dicts with `msgspec.structs.asdict` instead of `model_dump()`.
+    Frozen like the model, so candles can be deduplicated in a set directly.
+    """
+
+    tick: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    exchange: str | None = None
+    instrument_name: str | None = None
+    resolution: str | None = None
+    taker_buy_volume: float = 0.0
+    taker_sell_volume: float = 0.0
+    open_interest: float | None = None
+
+
+class StreamMessageStruct(msgspec.Struct, frozen=True):
+    """
+    Internal mirror of StreamMessage for the WebSocket ingest loop.
+    The channel-specific `data` payload stays an untyped dict, as on the model.
+    """
+
+    channel: str
+    exchange: str
+    timestamp: int
+    data: dict[str, Any]
+
+
+class SignalEventStruct(msgspec.Struct, frozen=True):
+    """
+    Internal mirror of SignalEvent for high-rate signal fan-out.
+    `metadata` shares the model's SignalMeta schema; note that msgspec decoding keeps only the
+    known SignalMeta keys, whereas the model also keeps extra ones.
+    """
+
+    timestamp: int
+    strategy_name: str
+    symbol: str
+    exchange: str
+    signal_type: str
+    strength: float
+    metadata: SignalMeta = msgspec.field(default_factory=dict)
+    metadata_raw: bytes | None = None
+
+
+# --- Event-Log Structs ---
+# Slot-backed, frozen mirrors of the high-throughput event models (~6x smaller per instance).
+# kw_only keeps field order identical to the Pydantic models despite interleaved defaults.
+
+
+class CycleCreatedEventStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Internal mirror of CycleCreatedEvent."""
+
+    type: Literal["cycle_created"] = "cycle_created"
+    strategy_name: str
+    instrument_ticker: str
+    initial_parameters: dict[str, Any]
+
+
+class OrderSentEventStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Internal mirror of OrderSentEvent."""
+
+    type: Literal["order_sent"] = "order_sent"
+    order_id: str
+    order_type: Literal["MARKET", "LIMIT", "STOP"]
+    side: Literal["BUY", "SELL"]
+    quantity: float
+    price: float | None = None
+
+
+class OrderFilledEventStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Internal mirror of OrderFilledEvent."""
+
+    type: Literal["order_filled"] = "order_filled"
+    order_id: str
+    fill_price: float
+    fill_quantity: float
+    commission: float = 0.0
+    timestamp: datetime
+
+
+# --- Exchange Payload Structs ---
+
+
+class TVResponse(msgspec.Struct):
+    """
+    Typed decode target for TradingView-style chart responses (columnar, dict of lists).
+    Decoding raw HTTP bytes into this struct parses and type-checks every column in one pass.
+    Unknown keys (e.g. 'status') are ignored.
+    """
+
+    ticks: list[int]
+    open: list[float]
+    high: list[float]
+    low: list[float]
+    close: list[float]
+    volume: list[float]
+    taker_buy_volume: list[float] = msgspec.field(default_factory=list)
+    taker_sell_volume: list[float] = msgspec.field(default_factory=list)
+
+
+# --- Hot-Path Decoders ---
+# Built once at import. Unlike struct construction, decoding does validate and type-check
+# every field, so these are safe entry points for untrusted JSON.
+
+OHLC_JSON_DECODER = msgspec.json.Decoder(OHLCStruct)
+_STREAM_MESSAGE_DECODER = msgspec.json.Decoder(StreamMessageStruct)
+
+
+def decode_stream(raw: bytes | str) -> StreamMessageStruct:
+    """
+    Parses and validates a WebSocket frame straight into a StreamMessageStruct in one pass,
+    with no intermediate dict or Pydantic validation. Raises msgspec.DecodeError /
+    msgspec.ValidationError on malformed frames.
+    Use `StreamMessage.model_validate(msgspec.structs.asdict(msg))` where the contract is needed.
+    """
+    return _STREAM_MESSAGE_DECODER.decode(raw)
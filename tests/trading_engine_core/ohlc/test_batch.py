@@ -0,0 +1,151 @@
+# tests/trading_engine_core/ohlc/test_batch.py
+
+import msgspec
+import pytest
+
+from trading_engine_core.ohlc.batch import OHLCBatch, OhlcFlushBuffer
+from trading_engine_core.ohlc.transformer import (
+    transform_tv_data_to_ohlc_batch,
+    transform_tv_data_to_ohlc_models,
+    transform_tv_data_to_ohlc_records,
+)
+from trading_engine_core.structs import OHLCStruct
+
+
+@pytest.fixture
+def sample_valid_tv_data():
+    """Provides a valid TradingView-style data dictionary with microstructure columns."""
+    return {
+        "ticks": [1672531200000, 1672531260000, 1672531320000],
+        "open": [100.0, 105.0, 107.0],
+        "high": [110.0, 108.0, 109.0],
+        "low": [99.0, 104.0, 106.0],
+        "close": [105.0, 107.0, 108.5],
+        "volume": [1000.0, 500.0, 250.0],
+        "taker_buy_volume": [600.0, 200.0, 100.0],
+        "taker_sell_volume": [400.0, 300.0, 150.0],
+    }
+
+
+def test_batch_emulates_list_of_rows(sample_valid_tv_data):
+    """
+    len(), indexing and iteration must expose the same rows as the model transformer.
+    """
+    batch = transform_tv_data_to_ohlc_batch(sample_valid_tv_data, "binance", "BTCUSDT", "1")
+    models = transform_tv_data_to_ohlc_models(sample_valid_tv_data, "binance", "BTCUSDT", "1")
+
+    assert len(batch) == 3
+    assert isinstance(batch[0], OHLCStruct)
+    assert batch[0].tick == 1672531200000
+    assert batch[-1].close == 108.5
+    assert [msgspec.structs.asdict(row) for row in batch] == [m.model_dump() for m in models]
+    assert batch.as_models() == models
+
+
+def test_batch_records_match_tuple_transformer(sample_valid_tv_data):
+    """
+    Batch records must be identical to the tuple transformer output.
+    """
+    batch = transform_tv_data_to_ohlc_batch(sample_valid_tv_data, "binance", "BTCUSDT", "1")
+    assert list(batch.records()) == list(transform_tv_data_to_ohlc_records(sample_valid_tv_data, "binance", "BTCUSDT", "1"))
+
+
+def test_batch_from_invalid_data():
+    """
+    Unusable payloads produce an empty (falsy) batch.
+    """
+    batch = transform_tv_data_to_ohlc_batch({"ticks": 12345}, "binance", "BTCUSDT", "1")
+    assert len(batch) == 0
+    assert not batch
+    assert batch.as_models() == []
+
+
+def test_batch_concatenate_preserves_page_order(sample_valid_tv_data):
+    """
+    Concatenated pages must equal a single batch over the combined range.
+    """
+    full = transform_tv_data_to_ohlc_batch(sample_valid_tv_data, "binance", "BTCUSDT", "1")
+    first_page = {key: value[:2] for key, value in sample_valid_tv_data.items()}
+    second_page = {key: value[2:] for key, value in sample_valid_tv_data.items()}
+
+    pages = [transform_tv_data_to_ohlc_batch(page, "binance", "BTCUSDT", "1") for page in (first_page, second_page)]
+    merged = OHLCBatch.concatenate(pages)
+
+    assert list(merged.records()) == list(full.records())
+    assert merged.tick.dtype == full.tick.dtype
+
+
+def test_batch_concatenate_rejects_mixed_instruments(sample_valid_tv_data):
+    """
+    Batches for different instruments cannot be merged, and at least one batch is required.
+    """
+    btc = transform_tv_data_to_ohlc_batch(sample_valid_tv_data, "binance", "BTCUSDT", "1")
+    eth = transform_tv_data_to_ohlc_batch(sample_valid_tv_data, "binance", "ETHUSDT", "1")
+
+    with pytest.raises(ValueError):
+        OHLCBatch.concatenate([btc, eth])
+    with pytest.raises(ValueError):
+        OHLCBatch.concatenate([])
+
+
+@pytest.mark.parametrize(("flush_rows", "expected_flushes"), [(3, 4), (6, 2), (12, 1)])
+def test_flush_buffer_row_threshold(sample_valid_tv_data, flush_rows, expected_flushes):
+    """
+    The number of flushed writes must shrink proportionally to the row threshold,
+    and together the flushes must hold every buffered row in page order.
+    """
+    page = transform_tv_data_to_ohlc_batch(sample_valid_tv_data, "binance", "BTCUSDT", "1")
+    buffer = OhlcFlushBuffer(flush_rows=flush_rows, flush_ms=60_000)
+
+    flushed = [out for out in (buffer.add(page) for _ in range(4)) if out is not None]
+    remainder = buffer.drain()
+    if remainder is not None:
+        flushed.append(remainder)
+
+    assert len(flushed) == expected_flushes
+    assert len(buffer) == 0
+    assert list(OHLCBatch.concatenate(flushed).records()) == list(page.records()) * 4
+
+
+def test_flush_buffer_time_threshold(sample_valid_tv_data, monkeypatch):
+    """
+    A page arriving after flush_ms has elapsed triggers a flush even below the row threshold.
+    """
+    clock = iter([0.0, 0.1, 0.6])
+    monkeypatch.setattr("trading_engine_core.ohlc.batch.time.monotonic", lambda: next(clock))
+    page = transform_tv_data_to_ohlc_batch(sample_valid_tv_data, "binance", "BTCUSDT", "1")
+    buffer = OhlcFlushBuffer(flush_rows=1_000, flush_ms=500)
+
+    assert buffer.add(page) is None
+    flushed = buffer.add(page)
+
+    assert flushed is not None and len(flushed) == 6
+    assert buffer.drain() is None
+
+
+def test_flush_buffer_ignores_empty_pages_and_bad_config():
+    """
+    Empty pages are not buffered, and non-positive thresholds are rejected.
+    """
+    buffer = OhlcFlushBuffer(flush_rows=1)
+    assert buffer.add(OHLCBatch.empty("binance", "BTCUSDT", "1")) is None
+    assert len(buffer) == 0
+
+    with pytest.raises(ValueError):
+        OhlcFlushBuffer(flush_rows=0)
+
+
+def test_flush_buffer_rejects_mixed_pages_without_data_loss(sample_valid_tv_data):
+    """
+    A page for another instrument is refused in add(), and the pages already buffered survive.
+    """
+    btc = transform_tv_data_to_ohlc_batch(sample_valid_tv_data, "binance", "BTCUSDT", "1")
+    eth = transform_tv_data_to_ohlc_batch(sample_valid_tv_data, "binance", "ETHUSDT", "1")
+    buffer = OhlcFlushBuffer(flush_rows=1_000, flush_ms=60_000)
+
+    assert buffer.add(btc) is None
+    with pytest.raises(ValueError):
+        buffer.add(eth)
+
+    assert len(buffer) == 3
+    assert list(buffer.drain().records()) == list(btc.records())
@@ -1,9 +1,24 @@
 # tests/trading_engine_core/ohlc/test_transformer.py
 
+from collections.abc import Iterator
+
+import msgspec
+import numpy as np
 import pytest
+from loguru import logger
 
 from trading_engine_core.models import OHLCModel
-from trading_engine_core.ohlc.transformer import transform_tv_data_to_ohlc_models
+from trading_engine_core.ohlc.transformer import (
+    OHLC_RECORD_FIELDS,
+    transform_canonical_list_to_ohlc_models,
+    transform_tv_bytes_to_ohlc_structs,
+    transform_tv_data_to_ohlc_arrays,
+    transform_tv_data_to_ohlc_batch,
+    transform_tv_data_to_ohlc_models,
+    transform_tv_data_to_ohlc_records,
+    transform_tv_data_to_ohlc_structs,
+)
+from trading_engine_core.structs import OHLCStruct
 
 
 @pytest.fixture
@@ -88,6 +103,22 @@ def test_transform_missing_key():
     result = transform_tv_data_to_ohlc_models(invalid_data, "binance", "BTCUSDT", "1")
     assert result == []
 
+    scalar_data = dict.fromkeys(("ticks", "open", "high", "low", "close", "volume"), 1)
+    assert transform_tv_data_to_ohlc_models(scalar_data, "binance", "BTCUSDT", "1") == []
+
+
+@pytest.mark.parametrize("text", ["12", b"12", bytearray(b"12")])
+def test_transform_text_columns_rejected(text):
+    """
+    str/bytes columns are sized but not lists; they must not be split into per-character candles.
+    """
+    text_data = dict.fromkeys(("ticks", "open", "high", "low", "close", "volume"), text)
+
+    assert transform_tv_data_to_ohlc_structs(text_data, "binance", "BTCUSDT", "1") == []
+    assert transform_tv_data_to_ohlc_models(text_data, "binance", "BTCUSDT", "1") == []
+    assert transform_tv_data_to_ohlc_arrays(text_data, "BTCUSDT") == {}
+    assert list(transform_tv_data_to_ohlc_records(text_data, "binance", "BTCUSDT", "1")) == []
+
 
 def test_transform_non_list_data():
     """
@@ -98,6 +129,15 @@ def test_transform_non_list_data():
     assert result == []
 
 
+def test_transform_accepts_tuple_columns(sample_valid_tv_data):
+    """
+    Column validation is duck-typed: any sized sequence (e.g. tuples) is accepted.
+    """
+    tuple_data = {key: tuple(value) if isinstance(value, list) else value for key, value in sample_valid_tv_data.items()}
+    result = transform_tv_data_to_ohlc_models(tuple_data, "binance", "BTCUSDT", "1")
+    assert [m.tick for m in result] == sample_valid_tv_data["ticks"]
+
+
 def test_transform_non_dict_input():
     """
     Tests robustness against the top-level input not being a dictionary.
@@ -107,3 +147,235 @@ def test_transform_non_dict_input():
 
     result = transform_tv_data_to_ohlc_models([], "binance", "BTCUSDT", "1")
     assert result == []
+
+
+def test_transform_structs_matches_models(sample_valid_tv_data):
+    """
+    The struct fast path must carry exactly the same data as the model path.
+    """
+    sample_valid_tv_data["taker_buy_volume"] = [600.0, 200.0]
+    sample_valid_tv_data["taker_sell_volume"] = [400.0, 300.0]
+
+    models = transform_tv_data_to_ohlc_models(sample_valid_tv_data, "binance", "BTCUSDT", "1")
+    structs = transform_tv_data_to_ohlc_structs(sample_valid_tv_data, "binance", "BTCUSDT", "1")
+
+    assert all(isinstance(item, OHLCStruct) for item in structs)
+    assert [msgspec.structs.asdict(s) for s in structs] == [m.model_dump() for m in models]
+
+
+def test_transform_structs_invalid_data(sample_valid_tv_data):
+    """
+    The struct fast path shares the model path's validation and error contract.
+    """
+    sample_valid_tv_data["open"][1] = "not-a-number"
+    assert transform_tv_data_to_ohlc_structs(sample_valid_tv_data, "binance", "BTCUSDT", "1") == []
+    assert transform_tv_data_to_ohlc_structs(None, "binance", "BTCUSDT", "1") == []
+
+
+def test_transform_records_field_order(sample_valid_tv_data):
+    """
+    DB tuples must line up with OHLC_RECORD_FIELDS and mirror the model values.
+    """
+    assert isinstance(transform_tv_data_to_ohlc_records(sample_valid_tv_data, "binance", "BTCUSDT", "1"), Iterator)
+
+    models = transform_tv_data_to_ohlc_models(sample_valid_tv_data, "binance", "BTCUSDT", "1")
+    records = list(transform_tv_data_to_ohlc_records(sample_valid_tv_data, "binance", "BTCUSDT", "1"))
+
+    assert len(records) == 2
+    for model, record in zip(models, records, strict=True):
+        assert dict(zip(OHLC_RECORD_FIELDS, record, strict=True)) == model.model_dump(include=set(OHLC_RECORD_FIELDS))
+
+    sample_valid_tv_data["volume"].pop()
+    assert list(transform_tv_data_to_ohlc_records(sample_valid_tv_data, "binance", "BTCUSDT", "1")) == []
+
+
+def test_transform_arrays(sample_valid_tv_data):
+    """
+    The columnar path must return typed, contiguous arrays with zeroed microstructure defaults.
+    """
+    arrays = transform_tv_data_to_ohlc_arrays(sample_valid_tv_data, "BTCUSDT")
+
+    assert arrays["tick"].dtype == np.int64
+    assert arrays["close"].dtype == np.float64
+    assert arrays["tick"].tolist() == sample_valid_tv_data["ticks"]
+    assert arrays["high"].tolist() == sample_valid_tv_data["high"]
+    assert arrays["taker_buy_volume"].tolist() == [0.0, 0.0]
+    assert all(arr.flags["C_CONTIGUOUS"] for arr in arrays.values())
+
+
+@pytest.mark.parametrize("bad_open", [["abc", 1.0], [[1.0, 2.0], [3.0, 4.0]]])
+def test_transform_arrays_invalid_data(sample_valid_tv_data, bad_open):
+    """
+    Uncastable or nested values must yield an empty result instead of raising.
+    """
+    sample_valid_tv_data["open"] = bad_open
+    assert transform_tv_data_to_ohlc_arrays(sample_valid_tv_data, "BTCUSDT") == {}
+    assert transform_tv_data_to_ohlc_arrays(None, "BTCUSDT") == {}
+
+
+def test_transform_error_logging_is_brace_safe(sample_valid_tv_data):
+    """
+    Error messages containing braces (echoed from bad payloads) must not break log formatting.
+    """
+    sample_valid_tv_data["open"][0] = "{bad}"
+    assert transform_tv_data_to_ohlc_models(sample_valid_tv_data, "binance", "BTCUSDT", "1") == []
+
+
+def test_transform_null_values(sample_valid_tv_data):
+    """
+    Null values must be rejected rather than silently becoming NaN in the NumPy cast.
+    """
+    sample_valid_tv_data["close"][1] = None
+    assert transform_tv_data_to_ohlc_models(sample_valid_tv_data, "binance", "BTCUSDT", "1") == []
+    assert transform_tv_data_to_ohlc_arrays(sample_valid_tv_data, "BTCUSDT") == {}
+
+
+def test_transform_non_finite_tick(sample_valid_tv_data):
+    """
+    A non-finite tick (int() raises OverflowError) is rejected like any other bad value.
+    """
+    sample_valid_tv_data["ticks"][0] = float("inf")
+    assert transform_tv_data_to_ohlc_models(sample_valid_tv_data, "binance", "BTCUSDT", "1") == []
+    assert transform_tv_data_to_ohlc_structs(sample_valid_tv_data, "binance", "BTCUSDT", "1") == []
+    assert list(transform_tv_data_to_ohlc_records(sample_valid_tv_data, "binance", "BTCUSDT", "1")) == []
+
+
+def test_transform_canonical_list_skips_bad_rows():
+    """
+    Row-based input keeps valid rows and skips rows missing required keys.
+    """
+    good = {
+        "exchange": "binance",
+        "instrument_name": "BTCUSDT",
+        "resolution": "1",
+        "tick": 1,
+        "open": 1.0,
+        "high": 2.0,
+        "low": 0.5,
+        "close": 1.5,
+        "volume": 10.0,
+    }
+    bad = {"exchange": "binance", "tick": 2}
+
+    result = transform_canonical_list_to_ohlc_models([good, bad])
+    assert [m.tick for m in result] == [1]
+
+
+def test_transform_bytes_matches_dict_path(sample_valid_tv_data):
+    """
+    Decoding raw response bytes must match the dict-based struct path.
+    """
+    body = msgspec.json.encode(sample_valid_tv_data)
+
+    from_bytes = transform_tv_bytes_to_ohlc_structs(body, "binance", "BTCUSDT", "1")
+    from_dict = transform_tv_data_to_ohlc_structs(sample_valid_tv_data, "binance", "BTCUSDT", "1")
+
+    assert from_bytes == from_dict
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"not json",
+        b'{"ticks": [1], "open": ["x"], "high": [1], "low": [1], "close": [1], "volume": [1]}',
+        b'{"ticks": [1, 2], "open": [1], "high": [1], "low": [1], "close": [1], "volume": [1]}',
+        b'{"ticks": [1]}',
+    ],
+)
+def test_transform_bytes_invalid_payload(body):
+    """
+    Malformed JSON, wrong types, mismatched lengths and missing columns all yield [].
+    """
+    assert transform_tv_bytes_to_ohlc_structs(body, "binance", "BTCUSDT", "1") == []
+
+
+def test_transform_structural_failures_short_circuit(sample_valid_tv_data):
+    """
+    Missing keys are reported by name before any column is touched, while an empty
+    window is a normal response that yields nothing without logging an error.
+    """
+    messages = []
+    sink_id = logger.add(messages.append, level="ERROR", format="{message}")
+    try:
+        del sample_valid_tv_data["volume"]
+        assert transform_tv_data_to_ohlc_arrays(sample_valid_tv_data, "BTCUSDT") == {}
+        assert len(messages) == 1
+        assert "['volume']" in messages[0]
+
+        empty_data = {"ticks": [], "open": [], "high": [], "low": [], "close": [], "volume": []}
+        assert transform_tv_data_to_ohlc_arrays(empty_data, "BTCUSDT") == {}
+        assert len(messages) == 1
+    finally:
+        logger.remove(sink_id)
+
+
+def test_transform_null_microstructure_column(sample_valid_tv_data):
+    """
+    A null optional column is treated as absent instead of raising.
+    """
+    sample_valid_tv_data["taker_buy_volume"] = None
+    sample_valid_tv_data["taker_sell_volume"] = [1.0, 2.0]
+
+    models = transform_tv_data_to_ohlc_models(sample_valid_tv_data, "binance", "BTCUSDT", "1")
+    assert len(models) == 2
+    assert models[0].taker_buy_volume == models[0].taker_sell_volume == 0.0
+    assert len(transform_tv_data_to_ohlc_structs(sample_valid_tv_data, "binance", "BTCUSDT", "1")) == 2
+
+
+def test_canonical_list_interns_labels():
+    """
+    Row-based input builds fresh label strings per row; equal labels must share one object.
+    """
+
+    def row(tick: int) -> dict:
+        # "".join builds a fresh, non-interned str on every call
+        return {
+            "exchange": "".join(["bin", "ance"]),
+            "instrument_name": "".join(["BTC", "USDT"]),
+            "resolution": "".join(["1", "5"]),
+            "tick": tick,
+            "open": 1.0,
+            "high": 1.0,
+            "low": 1.0,
+            "close": 1.0,
+            "volume": 1.0,
+        }
+
+    first, second = transform_canonical_list_to_ohlc_models([row(1672531200000), row(1672531260000)])
+    assert first.exchange is second.exchange
+    assert first.instrument_name is second.instrument_name
+    assert first.resolution is second.resolution
+
+
+@pytest.mark.parametrize(
+    ("transform", "empty"),
+    [
+        (transform_tv_data_to_ohlc_models, []),
+        (transform_tv_data_to_ohlc_structs, []),
+        (lambda *args: list(transform_tv_data_to_ohlc_records(*args)), []),
+        (lambda *args: len(transform_tv_data_to_ohlc_batch(*args)), 0),
+    ],
+    ids=["models", "structs", "records", "batch"],
+)
+@pytest.mark.parametrize("labels", [(123, "BTCUSDT", "1"), ("binance", b"BTCUSDT", "1"), ("binance", "BTCUSDT", 1)])
+def test_transform_rejects_bad_labels(sample_valid_tv_data, transform, empty, labels):
+    """
+    Non-str labels must yield an empty result from every entry point, never raise or leak into rows.
+    """
+    assert transform(sample_valid_tv_data, *labels) == empty
+
+
+def test_transform_bytes_rejects_bad_labels():
+    """
+    The raw-bytes entry point follows the same label contract.
+    """
+    body = b'{"ticks": [1], "open": [1.0], "high": [1.0], "low": [1.0], "close": [1.0], "volume": [1.0]}'
+    assert transform_tv_bytes_to_ohlc_structs(body, 123, "BTCUSDT", "1") == []
+
+
+def test_transform_models_catches_validation_errors(sample_valid_tv_data, monkeypatch):
+    """
+    Any ValidationError from the batched model validation is logged and turned into [].
+    """
+    monkeypatch.setattr("trading_engine_core.ohlc.batch.OHLCBatch.as_models", lambda self: OHLCModel.batch_validate([{"tick": "soon"}]))
+    assert transform_tv_data_to_ohlc_models(sample_valid_tv_data, "binance", "BTCUSDT", "1") == []
@@ -0,0 +1,122 @@
+# tests/trading_engine_core/ohlc/test_utils.py
+
+import time
+from datetime import timedelta
+
+import pytest
+
+from trading_engine_core.ohlc.utils import (
+    BACKOFF_SCHEDULE,
+    backoff_delay,
+    compile_instrument_whitelist,
+    iter_fetch_windows,
+    parse_resolution_to_timedelta,
+    resolution_to_ms,
+    utc_now_ms,
+)
+
+
+@pytest.mark.parametrize(
+    ("resolution", "expected_ms"),
+    [
+        ("1", 60_000),
+        ("60", 3_600_000),
+        ("5m", 300_000),
+        ("1h", 3_600_000),
+        ("1D", 86_400_000),
+        ("D", 86_400_000),
+        ("1W", 604_800_000),
+    ],
+)
+def test_resolution_to_ms(resolution, expected_ms):
+    """
+    Validates conversion of supported resolution formats to milliseconds.
+    """
+    assert resolution_to_ms(resolution) == expected_ms
+
+
+@pytest.mark.parametrize("resolution", ["", "0", "1x", "abc", "-5"])
+def test_resolution_to_ms_invalid(resolution):
+    """
+    Unsupported or non-positive resolutions must raise ValueError.
+    """
+    with pytest.raises(ValueError):
+        resolution_to_ms(resolution)
+
+
+def test_resolution_to_ms_is_cached():
+    """
+    Repeated lookups of the same resolution must be served from the cache.
+    """
+    resolution_to_ms.cache_clear()
+    resolution_to_ms("15")
+    resolution_to_ms("15")
+    assert resolution_to_ms.cache_info().hits == 1
+
+
+def test_parse_resolution_to_timedelta():
+    """
+    The timedelta helper must agree with resolution_to_ms and return the cached instance.
+    """
+    assert parse_resolution_to_timedelta("60") == timedelta(hours=1)
+    assert parse_resolution_to_timedelta("1D") == timedelta(days=1)
+    assert parse_resolution_to_timedelta("5") is parse_resolution_to_timedelta("5")
+
+    with pytest.raises(ValueError):
+        parse_resolution_to_timedelta("1x")
+
+
+def test_utc_now_ms():
+    """
+    The integer clock must agree with time.time() at millisecond precision.
+    """
+    now_ms = utc_now_ms()
+    assert isinstance(now_ms, int)
+    assert abs(now_ms - time.time() * 1000) < 1000
+
+
+def test_iter_fetch_windows():
+    """
+    Windows must tile the range contiguously, with the last one clipped to end_ts.
+    """
+    windows = list(iter_fetch_windows(0, 250_000, 60_000, 2))
+    assert windows == [(0, 120_000), (120_000, 240_000), (240_000, 250_000)]
+    assert list(iter_fetch_windows(100, 100, 60_000, 2)) == []
+
+    with pytest.raises(ValueError):
+        list(iter_fetch_windows(0, 1, 60_000, 0))
+
+
+@pytest.mark.parametrize(
+    ("whitelist", "instrument", "expected"),
+    [
+        (["BTC-PERP"], "BTC-PERP", True),
+        (["BTC-PERP"], "ETH-PERP", False),
+        (["BTC-PERP", "ETH-*"], "ETH-27DEC24", True),
+        (["BTC-PERP", "ETH-*"], "SOL-PERP", False),
+        (["*-PERPETUAL"], "BTC-PERPETUAL", True),
+        (["*-PERPETUAL"], "BTC-PERPETUAL-X", False),
+        (["BTC?USDT"], "BTCSUSDT", True),
+        ([], "BTC-PERP", False),
+    ],
+)
+def test_compile_instrument_whitelist(whitelist, instrument, expected):
+    """
+    Exact names and glob patterns must both match whole instrument names only.
+    """
+    assert compile_instrument_whitelist(whitelist)(instrument) is expected
+
+
+def test_backoff_schedule_and_jitter(monkeypatch):
+    """
+    Delays double from 0.1s up to the 10s cap, and jitter stays within 0.5x-1.5x of the step.
+    """
+    assert BACKOFF_SCHEDULE[:3] == (0.1, 0.2, 0.4)
+    assert BACKOFF_SCHEDULE[-1] == 10.0
+
+    monkeypatch.setattr("trading_engine_core.ohlc.utils.random.random", lambda: 0.0)
+    assert backoff_delay(0) == pytest.approx(0.05)
+    assert backoff_delay(100) == pytest.approx(5.0)
+
+    monkeypatch.setattr("trading_engine_core.ohlc.utils.random.random", lambda: 0.999)
+    assert backoff_delay(2) == pytest.approx(0.4 * 1.499)
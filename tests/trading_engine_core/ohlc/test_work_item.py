@@ -0,0 +1,95 @@
+# tests/trading_engine_core/ohlc/test_work_item.py
+
+import json
+
+import msgspec
+import pytest
+
+from trading_engine_core.ohlc.work_item import WorkItem, decode_work_item, encode_work_item, encode_work_items
+
+
+@pytest.fixture
+def sample_work_item_dict():
+    """Provides a work item as currently produced by the discovery step."""
+    return {
+        "type": "backfill",
+        "exchange": "deribit",
+        "instrument": "BTC-PERPETUAL",
+        "market_type": "inverse_futures",
+        "resolution": "1",
+        "start_ts": 1672531200000,
+        "end_ts": 1672617600000,
+    }
+
+
+@pytest.mark.parametrize("wire_format", ["msgpack", "json"])
+def test_work_item_round_trip(sample_work_item_dict, wire_format):
+    """
+    Encoding then decoding must yield an identical WorkItem in either wire format.
+    """
+    item = WorkItem(**sample_work_item_dict)
+    assert decode_work_item(encode_work_item(item, wire_format)) == item
+
+
+def test_msgpack_payload_is_compact(sample_work_item_dict):
+    """
+    The default msgpack payload must be smaller than the JSON debug format.
+    """
+    item = WorkItem(**sample_work_item_dict)
+    assert encode_work_item(item) == msgspec.msgpack.encode(item)
+    assert len(encode_work_item(item)) < len(encode_work_item(item, "json"))
+
+
+def test_encode_work_items_batch(sample_work_item_dict):
+    """
+    Batch encoding must produce one payload per item, each identical to single encoding.
+    """
+    items = [WorkItem(**{**sample_work_item_dict, "resolution": res}) for res in ("1", "5", "60")]
+    payloads = encode_work_items(items)
+
+    assert payloads == [encode_work_item(item) for item in items]
+    assert [decode_work_item(p).resolution for p in payloads] == ["1", "5", "60"]
+
+
+def test_decode_stdlib_json_payload(sample_work_item_dict):
+    """
+    Payloads written by stdlib json producers must decode to typed attributes.
+    """
+    item = decode_work_item(json.dumps(sample_work_item_dict))
+    assert item.instrument == "BTC-PERPETUAL"
+    assert item.start_ts == 1672531200000
+
+
+def test_decode_rejects_malformed_payload(sample_work_item_dict):
+    """
+    Missing fields or wrong types must raise msgspec.ValidationError.
+    """
+    del sample_work_item_dict["end_ts"]
+    with pytest.raises(msgspec.ValidationError):
+        decode_work_item(json.dumps(sample_work_item_dict))
+
+    with pytest.raises(msgspec.ValidationError):
+        decode_work_item(b'{"partial": "dict"}')
+
+
+def test_decode_rejects_non_json_payload():
+    """
+    Garbage bytes off the queue must raise msgspec.DecodeError rather than reach a worker.
+    """
+    with pytest.raises(msgspec.DecodeError):
+        decode_work_item(b"not-json")
+    with pytest.raises(msgspec.DecodeError):
+        decode_work_item(b"{not-json")
+
+
+def test_work_item_defaults_and_is_frozen(sample_work_item_dict):
+    """
+    market_type defaults to "spot" when omitted, and decoded items are immutable.
+    """
+    del sample_work_item_dict["market_type"]
+    item = decode_work_item(json.dumps(sample_work_item_dict))
+
+    assert item.market_type == "spot"
+    with pytest.raises(AttributeError):
+        item.instrument = "ETH-PERPETUAL"
+    assert hash(item) == hash(WorkItem(**sample_work_item_dict))
@@ -0,0 +1,13 @@
+# tests/trading_engine_core/test_enums.py
+
+from trading_engine_core.enums import MarketType
+
+
+def test_market_type_is_plain_string():
+    """
+    MarketType members must behave as their raw string values.
+    """
+    assert MarketType.SPOT == "spot"
+    assert str(MarketType.LINEAR_FUTURES) == "linear_futures"
+    assert f"{MarketType.INVERSE_OPTIONS}" == "inverse_options"
+    assert MarketType("spot") is MarketType.SPOT
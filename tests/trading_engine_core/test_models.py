@@ -1,36 +1,168 @@
 # tests/trading_engine_core/test_models.py
 
+import importlib
+import os
+
+import msgspec
+import numpy as np
+import pydantic
+import pydantic_core
 import pytest
 from pydantic import ValidationError
 
-from trading_engine_core.models import OHLCModel, SignalEvent, StreamMessage
+from trading_engine_core.enums import MarketType
+from trading_engine_core.models import (
+    EVENT_ADAPTER,
+    BaseEvent,
+    CycleClosedEvent,
+    CycleCreatedEvent,
+    CycleStateUpdatedEvent,
+    EnhancedSignalEvent,
+    MarketDefinition,
+    OHLCModel,
+    OrderFilledEvent,
+    OrderSentEvent,
+    SignalEvent,
+    StreamMessage,
+)
 
 
-def test_ohlc_model_instantiation_happy_path():
+@pytest.mark.parametrize("build", [lambda d: OHLCModel(**d), OHLCModel.from_trusted], ids=["validated", "trusted"])
+def test_ohlc_model_instantiation_happy_path(build):
     """
     Validates that OHLCModel can be created with all required fields
     and that new microstructure fields have correct defaults.
+    The trusted factory must produce the same model as the validating constructor.
     """
     tick_ms = 1672531200000  # 2023-01-01 00:00:00 UTC
+    data = {
+        "tick": tick_ms,
+        "open": 100.0,
+        "high": 110.0,
+        "low": 99.0,
+        "close": 105.0,
+        "volume": 1000.0,
+        "taker_buy_volume": 600.0,
+        "taker_sell_volume": 400.0,
+        "instrument_name": "BTC-PERPETUAL",
+        "resolution": "1",
+    }
 
-    candle = OHLCModel(
-        tick=tick_ms,
-        open=100.0,
-        high=110.0,
-        low=99.0,
-        close=105.0,
-        volume=1000.0,
-        taker_buy_volume=600.0,
-        taker_sell_volume=400.0,
-        instrument_name="BTC-PERPETUAL",
-        resolution="1",
-    )
+    candle = build(data)
 
     assert candle.tick == tick_ms
     assert candle.high == 110.0
     assert candle.taker_buy_volume == 600.0
     assert candle.taker_sell_volume == 400.0
     assert candle.instrument_name == "BTC-PERPETUAL"
+    assert candle.exchange is None
+    assert candle == OHLCModel(**data)
+    assert candle.model_fields_set == set(data)
+    with pytest.raises(ValidationError):
+        candle.close = 0.0
+
+
+def test_ohlc_hashable():
+    """
+    Frozen candles are hashable, so equal candles dedupe in a set regardless of how they were built.
+    """
+    row = {"tick": 1672531200000, "open": 100.0, "high": 110.0, "low": 99.0, "close": 105.0, "volume": 1000.0}
+
+    assert len({OHLCModel(**row), OHLCModel(**row), OHLCModel.from_trusted(row)}) == 1
+    assert len({OHLCModel(**row), OHLCModel(**{**row, "tick": row["tick"] + 60_000})}) == 2
+
+
+def test_from_tuple_equivalence():
+    """
+    The positional builder must match keyword construction, including defaults.
+    """
+    kw = {"tick": 1672531200000, "open": 100.0, "high": 110.0, "low": 99.0, "close": 105.0, "volume": 1000.0}
+
+    assert OHLCModel.from_tuple(1672531200000, 100.0, 110.0, 99.0, 105.0, 1000.0) == OHLCModel(**kw)
+
+    row = (1672531200000, 100.0, 110.0, 99.0, 105.0, 1000.0, 600.0, 400.0, "BTC-PERPETUAL", "1", "deribit")
+    full = OHLCModel.from_tuple(*row)
+    assert full == OHLCModel(
+        **kw, taker_buy_volume=600.0, taker_sell_volume=400.0, instrument_name="BTC-PERPETUAL", resolution="1", exchange="deribit"
+    )
+    assert full.open_interest is None
+
+
+def test_ohlc_batch_validate():
+    """
+    Pins the batched ingest path: 1,000 rows validated in a single call, with the same
+    coercion and error behavior as the per-row constructor.
+    """
+    rows = [
+        {"tick": 1672531200000 + i * 60_000, "open": 100, "high": 110.0, "low": 99.0, "close": 105.0, "volume": 1000.0, "resolution": "1"}
+        for i in range(1000)
+    ]
+
+    candles = OHLCModel.batch_validate(rows)
+
+    assert len(candles) == 1000
+    assert candles[0] == OHLCModel(**rows[0])
+    assert candles[-1].tick == 1672531200000 + 999 * 60_000
+    assert isinstance(candles[0].open, float)
+
+    rows[500]["close"] = "n/a"
+    with pytest.raises(ValidationError):
+        OHLCModel.batch_validate(rows)
+
+
+def test_to_soa_shapes_and_dtype():
+    """
+    SoA columns must be C-contiguous, correctly typed and in candle order.
+    """
+    candles = [OHLCModel(tick=1672531200000 + i * 60_000, open=100.0 + i, high=110.0, low=99.0, close=105.0, volume=1000.0) for i in range(5)]
+
+    arrays = OHLCModel.to_soa(candles)
+
+    assert set(arrays) == {"tick", "open", "high", "low", "close", "volume", "taker_buy_volume", "taker_sell_volume"}
+    assert arrays["tick"].dtype == np.int64
+    assert all(arr.dtype == np.float64 for name, arr in arrays.items() if name != "tick")
+    assert all(arr.shape == (5,) and arr.flags["C_CONTIGUOUS"] for arr in arrays.values())
+    assert arrays["open"].tolist() == [100.0, 101.0, 102.0, 103.0, 104.0]
+    assert arrays["tick"][-1] == 1672531200000 + 4 * 60_000
+    assert OHLCModel.to_soa([])["close"].shape == (0,)
+
+
+# Absolute per-call budgets on the median, ~10-20x above typical figures so only gross regressions (e.g. a
+# pure-Python validator fallback) fail. Benchmarks are deselected from the default run (`-m "not benchmark"`
+# in addopts); run them with `pytest --no-cov -m benchmark`. For relative checks, add
+# `--benchmark-autosave` then `--benchmark-compare --benchmark-compare-fail=mean:25%`.
+_CONSTRUCTION_BUDGET_S = 25e-6
+_BATCH_BUDGET_S = 10e-3
+
+
+def _assert_median_within(benchmark, budget_s: float) -> None:
+    # No stats are collected under --benchmark-disable (also forced by pytest-benchmark under xdist)
+    if not benchmark.disabled:
+        assert benchmark.stats.stats.median < budget_s
+
+
+@pytest.mark.benchmark(group="models", max_time=0.5)
+def test_ohlc_construction_bench(benchmark):
+    """
+    Single-candle validated construction must stay within its latency budget.
+    """
+    row = {"tick": 1672531200000, "open": 100.0, "high": 110.0, "low": 99.0, "close": 105.0, "volume": 1000.0}
+    result = benchmark(lambda: OHLCModel(**row))
+
+    assert result.close == 105.0
+    _assert_median_within(benchmark, _CONSTRUCTION_BUDGET_S)
+
+
+@pytest.mark.benchmark(group="models", max_time=0.5)
+def test_ohlc_batch_validate_bench(benchmark):
+    """
+    Validating a 1,000-candle batch must stay within its latency budget.
+    """
+    rows = [{"tick": 1672531200000 + i * 60_000, "open": 100.0, "high": 110.0, "low": 99.0, "close": 105.0, "volume": 1000.0} for i in range(1000)]
+    result = benchmark(OHLCModel.batch_validate, rows)
+
+    assert len(result) == 1000
+    _assert_median_within(benchmark, _BATCH_BUDGET_S)
 
 
 def test_ohlc_model_default_volume_fields():
@@ -67,6 +199,19 @@ def test_ohlc_model_missing_required_fields():
     assert "open" in str(excinfo.value)
 
 
+def test_ohlc_model_and_events_are_frozen():
+    """
+    Candles and event-log entries are immutable once constructed.
+    """
+    candle = OHLCModel(tick=1672531200000, open=100.0, high=110.0, low=99.0, close=105.0, volume=1000.0)
+    with pytest.raises(ValidationError):
+        candle.close = 106.0
+
+    event = CycleClosedEvent(reason="take_profit", final_pnl=12.5)
+    with pytest.raises(ValidationError):
+        event.final_pnl = 0.0
+
+
 def test_stream_message_model():
     """
     Validates the basic structure of the StreamMessage data contract.
@@ -86,7 +231,7 @@ def test_signal_event_model():
     Validates the basic structure of the SignalEvent data contract.
     """
     event = SignalEvent(
-        timestamp=1672531200.5,
+        timestamp=1672531200500,
         strategy_name="volumeSpike",
         symbol="BTCUSDT",
         exchange="binance",
@@ -96,4 +241,193 @@ def test_signal_event_model():
     )
     assert event.strategy_name == "volumeSpike"
     assert event.strength == 0.85
+    assert event.model_dump_json().startswith('{"timestamp":1672531200500,')
     assert event.metadata["rvol"] == 5.2
+
+
+def test_signal_event_metadata_schema():
+    """
+    Known metadata keys are type-checked, while strategy-specific extra keys survive.
+    """
+    base = {"timestamp": 1672531200500, "strategy_name": "s", "symbol": "BTCUSDT", "exchange": "binance", "signal_type": "LONG", "strength": 0.5}
+
+    event = SignalEvent(**base, metadata={"rvol": 5, "venues": ["binance"], "zscore": 2.1})
+    assert event.metadata == {"rvol": 5.0, "venues": ["binance"], "zscore": 2.1}
+
+    with pytest.raises(ValidationError):
+        SignalEvent(**base, metadata={"rvol": "high"})
+    with pytest.raises(ValidationError):
+        SignalEvent(**{**base, "timestamp": 1672531200.5}, metadata={})
+
+
+@pytest.mark.parametrize("model_cls", [SignalEvent, EnhancedSignalEvent])
+@pytest.mark.parametrize("legacy_ts", [1672531200.0, 1672531200.5, "1672531200500"])
+def test_signal_timestamp_is_strict_int(model_cls, legacy_ts):
+    """
+    Legacy float-seconds (even whole-number floats) and string timestamps must be rejected, not coerced.
+    """
+    base = {"strategy_name": "s", "symbol": "BTCUSDT", "exchange": "binance", "signal_type": "LONG", "strength": 0.5}
+
+    assert model_cls(**base, timestamp=1672531200500).timestamp == 1672531200500
+    with pytest.raises(ValidationError):
+        model_cls(**base, timestamp=legacy_ts)
+    with pytest.raises(ValidationError):
+        model_cls.model_validate_json(
+            '{"timestamp": 1672531200.0, "strategy_name": "s", "symbol": "x", "exchange": "x", "signal_type": "x", "strength": 0.5}'
+        )
+
+
+def test_signal_event_lazy_metadata():
+    """
+    Raw metadata bytes are stored unparsed and decoded once, on first access.
+    """
+    event = SignalEvent(
+        timestamp=1672531200500,
+        strategy_name="volumeSpike",
+        symbol="BTCUSDT",
+        exchange="binance",
+        signal_type="LONG",
+        strength=0.85,
+        metadata_raw=b'{"rvol":5.2,"venues":["binance"]}',
+    )
+
+    assert event.metadata == {}
+    assert event.metadata_decoded["rvol"] == 5.2
+    assert event.metadata_decoded is event.metadata_decoded
+
+    eager = SignalEvent(**event.model_dump(exclude={"metadata_raw"}) | {"metadata": {"rvol": 1.5}})
+    assert eager.metadata_decoded == {"rvol": 1.5}
+
+
+def test_signal_event_lazy_metadata_rejects_bad_input():
+    """
+    Raw metadata must be the only metadata source and UTF-8; non-object or malformed JSON fails on access.
+    """
+    base = {"timestamp": 1672531200500, "strategy_name": "s", "symbol": "BTCUSDT", "exchange": "binance", "signal_type": "LONG", "strength": 0.5}
+
+    with pytest.raises(ValidationError):
+        SignalEvent(**base, metadata={"rvol": 1.0}, metadata_raw=b'{"rvol":5.2}')
+    with pytest.raises(ValidationError):
+        SignalEvent(**base, metadata_raw=b'{"source":"\xff"}')
+
+    with pytest.raises(msgspec.ValidationError):
+        _ = SignalEvent(**base, metadata_raw=b"[1,2]").metadata_decoded
+    with pytest.raises(msgspec.DecodeError):
+        _ = SignalEvent(**base, metadata_raw=b'{"rvol":').metadata_decoded
+
+    assert SignalEvent(**base, metadata_raw=b'{"rvol":5.2}').model_dump_json()
+
+
+@pytest.mark.parametrize("raw", ["linear_futures", b"linear_futures", MarketType.LINEAR_FUTURES])
+def test_market_definition_market_type_coercion(raw):
+    """
+    Validates that Pydantic coerces str, bytes and enum inputs to the canonical MarketType member.
+    """
+    market = MarketDefinition(
+        market_id="binance-futures",
+        exchange="binance",
+        market_type=raw,
+        output_stream_name="market:stream:binance:trades",
+    )
+    assert market.market_type is MarketType.LINEAR_FUTURES
+
+
+def test_market_definition_unknown_market_type():
+    """
+    Verifies that unknown market types are still rejected by Pydantic.
+    """
+    with pytest.raises(ValidationError):
+        MarketDefinition(market_id="x", exchange="x", market_type="perpetual_swap", output_stream_name="x")
+
+
+def test_order_sent_event_literals_from_json():
+    """
+    Validates Literal fields on the JSON ingest path and rejects unknown values.
+    """
+    event = OrderSentEvent.model_validate_json('{"order_id": "1", "order_type": "LIMIT", "side": "BUY", "quantity": 1.5, "price": 100.0}')
+    assert event.side == "BUY"
+    assert OrderSentEvent.model_config["cache_strings"] == "all"
+
+    with pytest.raises(ValidationError):
+        OrderSentEvent.model_validate_json('{"order_id": "1", "order_type": "LIMIT", "side": "HOLD", "quantity": 1.5}')
+
+
+def test_event_schemas_build_lazily():
+    """
+    BaseEvent never builds a schema; concrete events build theirs on first validation.
+    """
+    assert BaseEvent.__pydantic_complete__ is False
+
+    event = CycleStateUpdatedEvent(previous_status="OPEN", new_status="CLOSING", reason="stop_loss")
+    assert event.new_status == "CLOSING"
+    assert CycleStateUpdatedEvent.__pydantic_complete__ is True
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected_cls"),
+    [
+        ({"type": "cycle_created", "strategy_name": "s", "instrument_ticker": "BTC", "initial_parameters": {}}, CycleCreatedEvent),
+        ({"type": "order_sent", "order_id": "1", "order_type": "MARKET", "side": "SELL", "quantity": 1.0}, OrderSentEvent),
+        ({"type": "order_filled", "order_id": "1", "fill_price": 1.0, "fill_quantity": 1.0, "timestamp": "2023-01-01T00:00:00Z"}, OrderFilledEvent),
+        ({"type": "cycle_state_updated", "previous_status": "A", "new_status": "B", "reason": "r"}, CycleStateUpdatedEvent),
+        ({"type": "cycle_closed", "reason": "r", "final_pnl": 1.0}, CycleClosedEvent),
+    ],
+)
+def test_event_adapter_dispatches_on_type(payload, expected_cls):
+    """
+    The discriminated union must resolve each payload to its event class by `type`.
+    """
+    event = EVENT_ADAPTER.validate_python(payload)
+    assert type(event) is expected_cls
+    assert event.model_dump()["type"] == payload["type"]
+
+
+def test_event_adapter_rejects_unknown_type():
+    """
+    Unknown or missing discriminators must fail validation.
+    """
+    with pytest.raises(ValidationError):
+        EVENT_ADAPTER.validate_python({"type": "order_cancelled", "order_id": "1"})
+    with pytest.raises(ValidationError):
+        EVENT_ADAPTER.validate_python({"reason": "r", "final_pnl": 1.0})
+
+
+def test_pydantic_core_is_compiled():
+    """
+    Guards against silently running on a non-native pydantic-core build (e.g. an unsupported
+    CI platform): the models rely on the compiled Rust validators for their throughput.
+    """
+    assert pydantic.VERSION.startswith("2.")
+    assert pydantic_core._pydantic_core.__file__.endswith((".so", ".pyd"))
+
+
+@pytest.mark.skipif(os.environ.get("TRADING_ENGINE_CORE_CYTHONIZE") != "1", reason="only checked against the Cython build")
+@pytest.mark.parametrize("module_name", ["trading_engine_core.models", "trading_engine_core.ohlc.transformer"])
+def test_hot_path_module_compiled(module_name):
+    """
+    When testing the Cython build, the hot-path modules must load from the extension,
+    not silently fall back to the shipped .py sources.
+    """
+    assert importlib.import_module(module_name).__file__.endswith((".so", ".pyd"))
+
+
+@pytest.mark.parametrize(
+    ("model_cls", "row"),
+    [
+        (OHLCModel, {"tick": 1672531200000, "open": 100.0, "high": 110.0, "low": 99.0, "close": 105.0, "volume": 1000.0}),
+        (StreamMessage, {"channel": "trade.BTC-PERPETUAL", "exchange": "deribit", "timestamp": 1672531200123, "data": {}}),
+        (
+            SignalEvent,
+            {"timestamp": 1672531200500, "strategy_name": "s", "symbol": "BTCUSDT", "exchange": "binance", "signal_type": "LONG", "strength": 0.5},
+        ),
+    ],
+)
+def test_hot_path_models_reject_extras_and_are_frozen(model_cls, row):
+    """
+    Hot-path models use a closed, immutable schema: unknown keys fail and assignment is blocked.
+    """
+    model = model_cls(**row)
+    with pytest.raises(ValidationError):
+        model_cls(**row, spurious=1)
+    with pytest.raises(ValidationError):
+        model.exchange = "other"
@@ -0,0 +1,105 @@
+# tests/trading_engine_core/test_structs.py
+
+from datetime import UTC, datetime
+
+import msgspec
+import pytest
+
+from trading_engine_core.models import CycleCreatedEvent, OHLCModel, OrderFilledEvent, OrderSentEvent, SignalEvent, StreamMessage
+from trading_engine_core.structs import (
+    OHLC_JSON_DECODER,
+    CycleCreatedEventStruct,
+    OHLCStruct,
+    OrderFilledEventStruct,
+    OrderSentEventStruct,
+    SignalEventStruct,
+    StreamMessageStruct,
+    decode_stream,
+)
+
+
+@pytest.mark.parametrize(
+    ("struct_cls", "model_cls"),
+    [
+        (OHLCStruct, OHLCModel),
+        (StreamMessageStruct, StreamMessage),
+        (SignalEventStruct, SignalEvent),
+        (CycleCreatedEventStruct, CycleCreatedEvent),
+        (OrderSentEventStruct, OrderSentEvent),
+        (OrderFilledEventStruct, OrderFilledEvent),
+    ],
+)
+def test_struct_mirrors_model_fields(struct_cls, model_cls):
+    """
+    Guards against drift: every fast-path struct must carry exactly its model's fields and types.
+    """
+    struct_fields = {f.name: f.type for f in msgspec.structs.fields(struct_cls)}
+    assert set(struct_fields) == set(model_cls.model_fields)
+    assert struct_fields == {name: field.annotation for name, field in model_cls.model_fields.items()}
+
+
+def test_event_struct_round_trips_to_model():
+    """
+    Event structs are frozen and convert losslessly into their Pydantic contract.
+    """
+    event = OrderFilledEventStruct(order_id="abc", fill_price=100.5, fill_quantity=2.0, timestamp=datetime(2023, 1, 1, tzinfo=UTC))
+
+    with pytest.raises(AttributeError):
+        event.fill_price = 0.0
+
+    model = OrderFilledEvent.model_validate(msgspec.structs.asdict(event))
+    assert model.commission == 0.0
+    assert model.model_dump() == msgspec.structs.asdict(event)
+
+
+def test_ohlc_json_decoder_validates():
+    """
+    The module-level decoder must type-check JSON input and agree with the Pydantic contract.
+    """
+    body = b'{"tick": 1672531200000, "open": 100, "high": 110.0, "low": 99.0, "close": 105.0, "volume": 1000.0, "resolution": "1"}'
+    candle = OHLC_JSON_DECODER.decode(body)
+
+    assert candle.open == 100.0 and isinstance(candle.open, float)
+    assert msgspec.structs.asdict(candle) == OHLCModel.model_validate_json(body).model_dump()
+
+    with pytest.raises(msgspec.ValidationError):
+        OHLC_JSON_DECODER.decode(b'{"tick": "soon", "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0}')
+
+
+def test_ohlc_struct_is_frozen_and_hashable():
+    """
+    OHLCStruct mirrors the model's immutability, so struct candles dedupe in a set too.
+    """
+    candle = OHLCStruct(1672531200000, 100.0, 110.0, 99.0, 105.0, 1000.0)
+
+    with pytest.raises(AttributeError):
+        candle.close = 0.0
+    assert len({candle, OHLCStruct(1672531200000, 100.0, 110.0, 99.0, 105.0, 1000.0)}) == 1
+
+
+def test_decode_stream_bytes():
+    """
+    WebSocket frames decode directly into the struct mirror and convert to the StreamMessage contract.
+    """
+    raw = b'{"channel":"trade.BTC-PERPETUAL","exchange":"deribit","timestamp":1672531200123,"data":{"price":50000,"amount":0.1}}'
+    msg = decode_stream(raw)
+
+    assert msg.exchange == "deribit"
+    assert msg.data["price"] == 50000
+    assert StreamMessage.model_validate(msgspec.structs.asdict(msg)) == StreamMessage.model_validate_json(raw)
+
+    with pytest.raises(msgspec.ValidationError):
+        decode_stream(b'{"channel":"trade","exchange":"deribit","timestamp":"now","data":{}}')
+
+
+def test_signal_event_struct_decodes_typed_metadata():
+    """
+    Decoding into the mirror applies the SignalMeta schema to metadata, like the model does.
+    """
+    body = (
+        b'{"timestamp":1672531200500,"strategy_name":"s","symbol":"BTCUSDT","exchange":"binance","signal_type":"LONG","strength":0.5,"metadata":%s}'
+    )
+
+    assert msgspec.json.decode(body % b'{"rvol":5}', type=SignalEventStruct).metadata == {"rvol": 5.0}
+    with pytest.raises(msgspec.ValidationError):
+        msgspec.json.decode(body % b'{"rvol":"high"}', type=SignalEventStruct)